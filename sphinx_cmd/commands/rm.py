@@ -5,24 +5,92 @@ Command to delete unused .rst files and their unique assets.
 
 import os
 import re
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
-from sphinx_cmd.config import get_directive_patterns
+from sphinx_cmd.config import get_combined_directive_pattern
 
 
 def find_rst_files(path):
     """Find all .rst files in the given path."""
-    if os.path.isfile(path) and path.endswith(".rst"):
-        return [path]
     rst_files = []
-    for root, _, files in os.walk(path):
-        for file in files:
-            if file.endswith(".rst"):
-                rst_files.append(os.path.join(root, file))
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            # scandir exposes the entry type from the directory listing
+            # itself, avoiding the extra stat() per entry that os.walk does
+            entries = os.scandir(current)
+        except NotADirectoryError:
+            if current.endswith(".rst"):
+                rst_files.append(current)
+            continue
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".rst"):
+                    rst_files.append(entry.path)
     return rst_files
 
 
+# Parsed directive entries memoized on (path, mtime, size, pattern), so a
+# file reached from many parents -- or needed again by the include analysis
+# during deletion -- is read and scanned only once while it stays unchanged
+_extract_cache: dict = {}
+
+
+def _extract_direct_entries(file_path, combined_pattern, verbose=False):
+    """Parse one file for directive references without following includes.
+
+    Returns a tuple of ``(asset_path, directive)`` pairs in file order, with
+    ``asset_path`` still relative as written in the source.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        if verbose:
+            print(f"Skipping non-existent file: {file_path}")
+        return ()
+
+    key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size, combined_pattern)
+    entries = _extract_cache.get(key)
+    if entries is not None:
+        return entries
+
+    entries = []
+    try:
+        # A large buffer cuts read() syscalls, and errors="replace" keeps
+        # undecodable bytes from discarding the rest of the file: directive
+        # lines are ASCII, so they still match after replacement
+        with open(
+            file_path, encoding="utf-8", errors="replace", buffering=1 << 20
+        ) as f:
+            # Stream line by line instead of reading the whole file into memory
+            for line in f:
+                # Cheap prefix check first; most lines aren't directives, so
+                # the regex only runs on candidate lines
+                stripped = line.lstrip()
+                if not stripped.startswith(".. "):
+                    continue
+                match = combined_pattern.match(stripped)
+                if match is None:
+                    continue
+                entries.append((match.group("path").strip(), match.group("directive")))
+    except OSError as e:
+        print(f"Warning: Could not read {file_path}: {e}")
+
+    # Freeze before caching so shared results can't be mutated by callers
+    entries = tuple(entries)
+    _extract_cache[key] = entries
+    return entries
+
+
 def extract_assets(
     file_path,
     visited=None,
@@ -30,8 +98,15 @@ def extract_assets(
     context_path=None,
     verbose=False,
     base_dir=None,
+    combined_pattern=None,
 ):
-    """Extract asset references from an .rst file, recursively parsing includes."""
+    """Extract asset references from an .rst file, following includes.
+
+    Includes are walked iteratively with an explicit worklist, so circular
+    or deeply nested include chains can't blow the recursion limit. Note
+    that non-include assets are always resolved relative to the base
+    directory of the original file, even when found in an included file.
+    """
     if visited is None:
         visited = set()
 
@@ -39,93 +114,111 @@ def extract_assets(
     if base_dir is None:
         base_dir = os.path.dirname(file_path)
 
-    # Avoid circular includes
-    abs_path = os.path.abspath(file_path)
-    if abs_path in visited:
-        return {}
-    visited.add(abs_path)
-
-    if verbose:
-        print(f"Processing file: {file_path}")
+    if combined_pattern is None:
+        combined_pattern = get_combined_directive_pattern(cli_directives, context_path)
 
     asset_directives = {}
-    directive_patterns = get_directive_patterns(cli_directives, context_path)
 
-    # If file doesn't exist, skip it
-    if not os.path.exists(file_path):
+    # Fast path: most pages have no includes, so skip the traversal and
+    # cycle bookkeeping entirely and resolve their entries in one loop
+    entries = _extract_direct_entries(file_path, combined_pattern, verbose)
+    if not any(directive == "include" for _, directive in entries):
         if verbose:
-            print(f"Skipping non-existent file: {file_path}")
+            print(f"Processing file: {file_path}")
+        for asset_path, directive in entries:
+            asset_full_path = sys.intern(
+                os.path.normpath(os.path.join(base_dir, asset_path))
+            )
+            if verbose:
+                print(f"Found {directive}: {asset_path}")
+                print(f"  Absolute path: {os.path.abspath(asset_full_path)}")
+            asset_directives[asset_full_path] = directive
         return asset_directives
 
-    try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-            for directive, pattern in directive_patterns.items():
-                for match in pattern.findall(content):
-                    asset_path = match.strip()
-                    if directive == "include":
-                        # Include paths are resolved relative to the current file
-                        asset_full_path = os.path.normpath(
-                            os.path.join(os.path.dirname(file_path), asset_path)
-                        )
-                    else:
-                        # Non-include assets are resolved relative to the base directory
-                        asset_full_path = os.path.normpath(
-                            os.path.join(base_dir, asset_path)
-                        )
-                    asset_abs_path = os.path.abspath(asset_full_path)
+    stack = [file_path]
+    while stack:
+        current = stack.pop()
 
-                    if verbose:
-                        print(f"Found {directive}: {asset_path}")
-                        print(f"  Absolute path: {asset_abs_path}")
+        # Avoid circular includes
+        abs_path = os.path.abspath(current)
+        if abs_path in visited:
+            continue
+        visited.add(abs_path)
 
-                    if directive == "include":
-                        if verbose:
-                            print(f"Parsing include: {asset_full_path}")
-                        # Recursively extract assets from included files,
-                        # preserving base_dir
-                        included_assets = extract_assets(
-                            asset_full_path,
-                            visited,
-                            cli_directives,
-                            context_path,
-                            verbose,
-                            base_dir,
-                        )
-                        asset_directives.update(included_assets)
+        if verbose:
+            print(f"Processing file: {current}")
+
+        current_dir = os.path.dirname(current)
+        entries = _extract_direct_entries(current, combined_pattern, verbose)
+        for asset_path, directive in entries:
+            # Interning the resolved paths lets the index sets compare them
+            # by identity; the same asset shows up in many sets
+            if directive == "include":
+                # Include paths are resolved relative to the current file
+                asset_full_path = sys.intern(
+                    os.path.normpath(os.path.join(current_dir, asset_path))
+                )
+            else:
+                # Non-include assets are resolved relative to the base directory
+                asset_full_path = sys.intern(
+                    os.path.normpath(os.path.join(base_dir, asset_path))
+                )
 
-                    asset_directives[asset_full_path] = directive
-    except Exception as e:
-        print(f"Warning: Could not read {file_path}: {e}")
+            if verbose:
+                print(f"Found {directive}: {asset_path}")
+                print(f"  Absolute path: {os.path.abspath(asset_full_path)}")
+
+            if directive == "include":
+                if verbose:
+                    print(f"Parsing include: {asset_full_path}")
+                stack.append(asset_full_path)
+
+            asset_directives[asset_full_path] = directive
 
     return asset_directives
 
 
 def build_asset_index(rst_files, cli_directives=None, context_path=None, verbose=False):
-    """Build an index of assets and which files reference them."""
-    asset_to_files = defaultdict(set)
+    """Build an index of assets and how many files reference each of them."""
+    asset_refcount = defaultdict(int)
     file_to_assets = {}
     asset_directive_map = {}
 
     if verbose:
         print(f"Building asset index for {len(rst_files)} RST files...")
 
-    for rst in rst_files:
-        asset_directives = extract_assets(
-            rst,
-            cli_directives=cli_directives,
-            context_path=context_path,
-            verbose=verbose,
-        )
-        file_to_assets[rst] = set(asset_directives.keys())
+    # Compile the combined directive pattern once and reuse it for every file
+    combined_pattern = get_combined_directive_pattern(cli_directives, context_path)
+
+    # Extraction is independent per file and I/O-bound, so fan it out across
+    # a thread pool; the index itself is populated sequentially below. The
+    # module-level parse cache ensures each file is read at most once even
+    # when it is reached both directly and through includes.
+    extract = partial(
+        extract_assets,
+        cli_directives=cli_directives,
+        context_path=context_path,
+        verbose=verbose,
+        combined_pattern=combined_pattern,
+    )
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(extract, rst_files))
+
+    for rst, asset_directives in zip(rst_files, results):
+        rst = sys.intern(rst)
+        file_to_assets[rst] = frozenset(asset_directives.keys())
+        # Each asset appears at most once per file, so a plain counter is
+        # enough to know whether an asset is shared; storing the referencing
+        # file sets themselves would cost a set object per asset
         for asset, directive in asset_directives.items():
-            asset_to_files[asset].add(rst)
+            asset_refcount[asset] += 1
             asset_directive_map[asset] = directive
 
     if verbose:
-        print(f"Found {len(asset_to_files)} unique assets across all files")
+        print(f"Found {len(asset_refcount)} unique assets across all files")
 
-    return asset_to_files, file_to_assets, asset_directive_map
+    # Hand back a plain dict; the index is read-only from here on
+    return dict(asset_refcount), file_to_assets, asset_directive_map
 
 
 def get_transitive_includes(
@@ -134,63 +227,42 @@ def get_transitive_includes(
     cli_directives=None,
     context_path=None,
     verbose=False,
-    base_dir=None,
+    combined_pattern=None,
 ):
     """Get all files included transitively from a file."""
     if visited is None:
         visited = set()
 
-    # Use the directory of the original file as base for relative path resolution
-    if base_dir is None:
-        base_dir = os.path.dirname(file_path)
-
-    # Avoid circular includes
-    abs_path = os.path.abspath(file_path)
-    if abs_path in visited:
-        return set()
-    visited.add(abs_path)
-
-    if verbose:
-        print(f"Checking for includes in: {file_path}")
+    if combined_pattern is None:
+        combined_pattern = get_combined_directive_pattern(cli_directives, context_path)
 
     includes = set()
+    stack = [file_path]
+    while stack:
+        current = stack.pop()
 
-    if not os.path.exists(file_path):
-        if verbose:
-            print(f"Skipping non-existent file: {file_path}")
-        return includes
-
-    directive_patterns = get_directive_patterns(cli_directives, context_path)
+        # Avoid circular includes
+        abs_path = os.path.abspath(current)
+        if abs_path in visited:
+            continue
+        visited.add(abs_path)
 
-    try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-            # Only process include directive
-            if "include" in directive_patterns:
-                pattern = directive_patterns["include"]
-                for match in pattern.findall(content):
-                    include_path = match.strip()
-                    include_full_path = os.path.normpath(
-                        os.path.join(os.path.dirname(file_path), include_path)
-                    )
-                    includes.add(include_full_path)
-                    if verbose:
-                        print(f"Found include: {include_path}")
-
-                    # Recursively get includes from the included file,
-                    # preserving base_dir
-                    includes.update(
-                        get_transitive_includes(
-                            include_full_path,
-                            visited,
-                            cli_directives,
-                            context_path,
-                            verbose,
-                            base_dir,
-                        )
-                    )
-    except Exception as e:
-        print(f"Warning: Could not read {file_path}: {e}")
+        if verbose:
+            print(f"Checking for includes in: {current}")
+
+        current_dir = os.path.dirname(current)
+        entries = _extract_direct_entries(current, combined_pattern, verbose)
+        for include_path, directive in entries:
+            # Only process include directives
+            if directive != "include":
+                continue
+            include_full_path = os.path.normpath(
+                os.path.join(current_dir, include_path)
+            )
+            includes.add(include_full_path)
+            if verbose:
+                print(f"Found include: {include_path}")
+            stack.append(include_full_path)
 
     return includes
 
@@ -399,7 +471,7 @@ def remove_toctree_entries(file_path, entries_to_remove, dry_run=False, verbose=
 
 
 def delete_unused_assets_and_pages(
-    asset_to_files,
+    asset_refcount,
     file_to_assets,
     asset_directive_map,
     dry_run=False,
@@ -417,9 +489,21 @@ def delete_unused_assets_and_pages(
     affected_dirs = set()
     would_delete_something = False  # Flag to track if anything would be deleted
 
+    # Pages that were (or, in dry-run, would be) deleted; collected here so
+    # the toctree cleanup in execute() doesn't have to re-derive the list by
+    # re-scanning the whole index
+    pages_to_remove = []
+
     # Track which files have been processed to avoid duplicates
     processed_files = set()
 
+    # Assets referenced by more than one file; computed once so the per-file
+    # check below is a single C-level set operation
+    shared_assets = {a for a, count in asset_refcount.items() if count > 1}
+
+    # Normalize the context path once rather than per asset/file below
+    context_abs_path = os.path.abspath(context_path) if context_path else None
+
     if verbose:
         print("Analyzing files and assets for removal...")
 
@@ -430,15 +514,14 @@ def delete_unused_assets_and_pages(
                 print(f"Skipping already processed file: {rst_file}")
             continue
 
-        unused_assets = [a for a in assets if len(asset_to_files[a]) == 1]
-
         if verbose:
+            unused_count = sum(1 for a in assets if a not in shared_assets)
             print(
-                f"File: {rst_file} has {len(assets)} assets, {len(unused_assets)}"
+                f"File: {rst_file} has {len(assets)} assets, {unused_count}"
                 " are unique"
             )
 
-        if len(unused_assets) == len(assets):  # All assets are unique to this file
+        if assets.isdisjoint(shared_assets):  # All assets are unique to this file
             if verbose:
                 print(f"File {rst_file} has no shared assets, processing for removal")
 
@@ -460,56 +543,61 @@ def delete_unused_assets_and_pages(
 
                 processed_files.add(file_to_process)
                 file_assets = file_to_assets.get(file_to_process, set())
-                file_unused_assets = [
-                    a for a in file_assets if len(asset_to_files[a]) == 1
-                ]
+                file_unused_assets = [a for a in file_assets if a not in shared_assets]
 
                 # Delete unused assets for this file
                 for asset in file_unused_assets:
                     directive = asset_directive_map.get(asset, "asset")
-                    if os.path.exists(asset) and asset not in deleted_assets:
-                        # Check if asset is within context path if context is provided
-                        is_in_context = True
-                        if context_path:
-                            asset_abs_path = os.path.abspath(asset)
-                            context_abs_path = os.path.abspath(context_path)
-                            # Check if the asset path starts with the context path
-                            is_in_context = asset_abs_path.startswith(context_abs_path)
-
-                        if not is_in_context:
-                            if dry_run:
-                                print(
-                                    f"[dry-run] Skipping {directive} (outside context):"
-                                    f" {asset}"
-                                )
-                            elif verbose:
-                                print(f"Skipping asset (outside context): {asset}")
-                            continue
+                    if asset in deleted_assets:
+                        continue
 
+                    # Check if asset is within context path if context is provided
+                    is_in_context = True
+                    if context_abs_path:
+                        # Check if the asset path starts with the context path
+                        is_in_context = os.path.abspath(asset).startswith(
+                            context_abs_path
+                        )
+
+                    if not is_in_context:
                         if dry_run:
-                            origin = (
-                                " (from include)" if file_to_process != rst_file else ""
-                            )
                             print(
-                                f"[dry-run] Would delete {directive}: {asset}{origin}"
+                                f"[dry-run] Skipping {directive} (outside context):"
+                                f" {asset}"
                             )
-                            would_delete_something = True
-                        else:
-                            if verbose:
-                                print(f"Removing asset: {asset}")
-                            affected_dirs.add(os.path.dirname(asset))
+                        elif verbose:
+                            print(f"Skipping asset (outside context): {asset}")
+                        continue
+
+                    if dry_run:
+                        if not os.path.exists(asset):
+                            continue
+                        origin = (
+                            " (from include)" if file_to_process != rst_file else ""
+                        )
+                        print(f"[dry-run] Would delete {directive}: {asset}{origin}")
+                        would_delete_something = True
+                    else:
+                        # Remove directly and treat a missing file as already
+                        # gone, instead of a racy exists() + remove() pair
+                        try:
                             os.remove(asset)
-                            deleted_assets.append(asset)
+                        except FileNotFoundError:
+                            continue
+                        if verbose:
+                            print(f"Removing asset: {asset}")
+                        affected_dirs.add(os.path.dirname(asset))
+                        deleted_assets.append(asset)
 
-                # Delete the file if it exists and isn't the main rst file being checked
-                if file_to_process != rst_file and os.path.exists(file_to_process):
+                # Delete the file if it isn't the main rst file being checked
+                if file_to_process != rst_file:
                     # Check if file is within context path if context is provided
                     is_in_context = True
-                    if context_path:
-                        file_abs_path = os.path.abspath(file_to_process)
-                        context_abs_path = os.path.abspath(context_path)
+                    if context_abs_path:
                         # Check if the file path starts with the context path
-                        is_in_context = file_abs_path.startswith(context_abs_path)
+                        is_in_context = os.path.abspath(file_to_process).startswith(
+                            context_abs_path
+                        )
 
                     if not is_in_context:
                         if dry_run:
@@ -525,45 +613,61 @@ def delete_unused_assets_and_pages(
                         continue
 
                     if dry_run:
+                        if not os.path.exists(file_to_process):
+                            continue
                         print(
                             f"[dry-run] Would delete included file: {file_to_process}"
                         )
                         would_delete_something = True
+                        pages_to_remove.append(file_to_process)
                     else:
+                        try:
+                            os.remove(file_to_process)
+                        except FileNotFoundError:
+                            continue
                         if verbose:
                             print(f"Removing included file: {file_to_process}")
                         affected_dirs.add(os.path.dirname(file_to_process))
-                        os.remove(file_to_process)
                         deleted_pages.append(file_to_process)
+                        pages_to_remove.append(file_to_process)
 
             # Finally, delete the main rst file
-            if os.path.exists(rst_file):
-                # Check if file is within context path if context is provided
-                is_in_context = True
-                if context_path:
-                    file_abs_path = os.path.abspath(rst_file)
-                    context_abs_path = os.path.abspath(context_path)
-                    # Check if the file path starts with the context path
-                    is_in_context = file_abs_path.startswith(context_abs_path)
-
-                if not is_in_context:
-                    if dry_run:
-                        print(f"[dry-run] Skipping page (outside context): {rst_file}")
-                    elif verbose:
-                        print(f"Skipping page (outside context): {rst_file}")
-                    continue
+            # Check if file is within context path if context is provided
+            is_in_context = True
+            if context_abs_path:
+                # Check if the file path starts with the context path
+                is_in_context = os.path.abspath(rst_file).startswith(context_abs_path)
 
+            if not is_in_context:
                 if dry_run:
+                    print(f"[dry-run] Skipping page (outside context): {rst_file}")
+                elif verbose:
+                    print(f"Skipping page (outside context): {rst_file}")
+                continue
+
+            if dry_run:
+                if os.path.exists(rst_file):
                     print(f"[dry-run] Would delete page: {rst_file}")
                     would_delete_something = True
-                else:
-                    if verbose:
-                        print(f"Removing page: {rst_file}")
-                    affected_dirs.add(os.path.dirname(rst_file))
+                    pages_to_remove.append(rst_file)
+            else:
+                try:
                     os.remove(rst_file)
-                    deleted_pages.append(rst_file)
-
-    return deleted_pages, deleted_assets, affected_dirs, would_delete_something
+                except FileNotFoundError:
+                    continue
+                if verbose:
+                    print(f"Removing page: {rst_file}")
+                affected_dirs.add(os.path.dirname(rst_file))
+                deleted_pages.append(rst_file)
+                pages_to_remove.append(rst_file)
+
+    return (
+        deleted_pages,
+        deleted_assets,
+        affected_dirs,
+        would_delete_something,
+        pages_to_remove,
+    )
 
 
 def remove_empty_dirs(dirs, original_path, dry_run=False, verbose=False):
@@ -576,9 +680,11 @@ def remove_empty_dirs(dirs, original_path, dry_run=False, verbose=False):
     # Add parent directories to the affected dirs set
     all_dirs = set(dirs)
     for dir_path in dirs:
-        # Add all parent directories up to but not including the original path
+        # Add all parent directories up to but not including the original
+        # path, using pure string climbing (no stat calls); ancestors shared
+        # with an already-climbed branch are only walked once
         parent = os.path.dirname(dir_path)
-        while parent and os.path.exists(parent) and parent != original_path:
+        while parent and parent != original_path and parent not in all_dirs:
             all_dirs.add(parent)
             parent = os.path.dirname(parent)
 
@@ -590,32 +696,36 @@ def remove_empty_dirs(dirs, original_path, dry_run=False, verbose=False):
 
     # Process directories from deepest to shallowest
     for dir_path in sorted_dirs:
-        if not os.path.exists(dir_path) or not os.path.isdir(dir_path):
-            if verbose:
-                print(f"Skipping non-existent or non-directory path: {dir_path}")
+        if dry_run:
+            if os.path.isdir(dir_path) and not os.listdir(dir_path):
+                print(f"[dry-run] Would delete empty directory: {dir_path}")
             continue
 
-        # Check if directory is empty
-        if not os.listdir(dir_path):
-            if dry_run:
-                print(f"[dry-run] Would delete empty directory: {dir_path}")
-            else:
-                if verbose:
-                    print(f"Removing empty directory: {dir_path}")
-                os.rmdir(dir_path)
-                deleted_dirs.append(dir_path)
-        elif verbose:
-            print(f"Directory not empty, skipping: {dir_path}")
+        # rmdir itself fails on missing or non-empty directories, so rely on
+        # that instead of a racy exists()/listdir() pre-check
+        try:
+            os.rmdir(dir_path)
+        except OSError:
+            if verbose:
+                print(f"Directory missing or not empty, skipping: {dir_path}")
+            continue
+        if verbose:
+            print(f"Removing empty directory: {dir_path}")
+        deleted_dirs.append(dir_path)
 
     # Check if the original path (if it's a directory) is now empty and should
     # be removed
-    if os.path.isdir(original_path) and not os.listdir(original_path):
-        if dry_run:
+    if dry_run:
+        if os.path.isdir(original_path) and not os.listdir(original_path):
             print(f"[dry-run] Would delete empty directory: {original_path}")
+    else:
+        try:
+            os.rmdir(original_path)
+        except OSError:
+            pass
         else:
             if verbose:
                 print(f"Removing empty original directory: {original_path}")
-            os.rmdir(original_path)
             deleted_dirs.append(original_path)
 
     return deleted_dirs
@@ -648,45 +758,31 @@ def execute(args):
     else:
         print("Context path not set - all unused files will be removed")
 
-    asset_to_files, file_to_assets, asset_directive_map = build_asset_index(
+    asset_refcount, file_to_assets, asset_directive_map = build_asset_index(
         rst_files, cli_directives=directives, context_path=context_path, verbose=verbose
     )
 
-    deleted_pages, deleted_assets, affected_dirs, would_delete_something = (
-        delete_unused_assets_and_pages(
-            asset_to_files,
-            file_to_assets,
-            asset_directive_map,
-            dry_run,
-            context_path,
-            verbose,
-        )
+    (
+        deleted_pages,
+        deleted_assets,
+        affected_dirs,
+        would_delete_something,
+        files_to_remove,
+    ) = delete_unused_assets_and_pages(
+        asset_refcount,
+        file_to_assets,
+        asset_directive_map,
+        dry_run,
+        context_path,
+        verbose,
     )
 
     # Handle toctree updates (default behavior)
     toctree_updates = 0
     updated_toctree_files = []
     if deleted_pages or would_delete_something:
-        # Get list of files to be deleted (or would be deleted in dry-run)
-        files_to_remove = deleted_pages if not dry_run else []
-
-        # In dry-run mode, we need to determine which files would be deleted
-        if dry_run and would_delete_something:
-            files_to_remove = []
-            for rst_file, assets in file_to_assets.items():
-                unused_assets = [a for a in assets if len(asset_to_files[a]) == 1]
-                if len(unused_assets) == len(
-                    assets
-                ):  # All assets are unique to this file
-                    # Check context constraints like in delete_unused_assets_and_pages
-                    is_in_context = True
-                    if context_path:
-                        file_abs_path = os.path.abspath(rst_file)
-                        context_abs_path = os.path.abspath(context_path)
-                        is_in_context = file_abs_path.startswith(context_abs_path)
-                    if is_in_context:
-                        files_to_remove.append(rst_file)
-
+        # The removed (or would-be removed) pages are reported directly by
+        # delete_unused_assets_and_pages, so no second index scan is needed
         if files_to_remove:
             if verbose:
                 print(
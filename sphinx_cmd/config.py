@@ -17,6 +17,30 @@ else:
 # Default configuration with built-in directives
 DEFAULT_CONFIG = {"directives": ["image", "figure", "include"]}
 
+# Cache of compiled directive patterns, keyed on the config file path, its
+# mtime and any CLI directives, so repeated calls (one per scanned .rst file)
+# don't re-read the TOML file and recompile the same regexes.
+_PATTERN_CACHE: Dict[tuple, Dict[str, re.Pattern]] = {}
+
+# Cache of the combined single-pass pattern, keyed the same way
+_COMBINED_CACHE: Dict[tuple, re.Pattern] = {}
+
+
+def _pattern_cache_key(cli_directives=None) -> tuple:
+    """Build a cache key that is invalidated when the config file changes."""
+    config_path = get_config_path()
+    mtime = None
+    if config_path:
+        try:
+            mtime = config_path.stat().st_mtime_ns
+        except OSError:
+            config_path = None
+    return (
+        str(config_path) if config_path else None,
+        mtime,
+        tuple(cli_directives) if cli_directives else None,
+    )
+
 
 def get_config_path() -> Optional[Path]:
     """Get the path to the configuration file."""
@@ -133,6 +157,11 @@ def get_directive_patterns(
     Returns:
         Dict[str, re.Pattern]: Dictionary of directive names to compiled regex patterns
     """
+    key = _pattern_cache_key(cli_directives)
+    patterns = _PATTERN_CACHE.get(key)
+    if patterns is not None:
+        return patterns
+
     config = load_config(cli_directives, context_path)
     patterns = {}
 
@@ -141,9 +170,43 @@ def get_directive_patterns(
         pattern = rf"^\s*\.\.\s+{name}::\s+(.+)$"
         patterns[name] = re.compile(pattern, re.MULTILINE)
 
+    _PATTERN_CACHE[key] = patterns
     return patterns
 
 
+def get_combined_directive_pattern(
+    cli_directives=None, context_path=None
+) -> re.Pattern:
+    """
+    Get a single compiled regex that matches any configured directive.
+
+    The pattern exposes two named groups, ``directive`` (the directive name)
+    and ``path`` (the referenced asset path). It is meant to be matched
+    against individual lines (stripped of leading whitespace), so file
+    contents can be scanned in one pass instead of once per directive.
+
+    Args:
+        cli_directives: Optional list of directive names passed from the command line
+        context_path: Optional path to use as context for finding conf.py
+
+    Returns:
+        re.Pattern: Compiled regex matching any directive in the configuration
+    """
+    key = _pattern_cache_key(cli_directives)
+    pattern = _COMBINED_CACHE.get(key)
+    if pattern is not None:
+        return pattern
+
+    config = load_config(cli_directives, context_path)
+    names = "|".join(re.escape(name) for name in config["directives"])
+    # re.ASCII keeps \s from consulting the Unicode tables, and the trailing
+    # anchor is redundant when matching a single line (. stops at newline)
+    pattern = re.compile(rf"\.\.\s+(?P<directive>{names})::\s+(?P<path>.+)", re.ASCII)
+
+    _COMBINED_CACHE[key] = pattern
+    return pattern
+
+
 def get_sphinx_context(cli_context: Optional[str] = None) -> Optional[Path]:
     """
     Get the Sphinx documentation context directory.